@@ -30,3 +30,11 @@ def test_app_args_basic():
 
     parsed = parser.parse_args(["a"])
     assert command(parsed) == 0
+
+    # Commands can be registered into a caller-provided table.
+    table: dict[str, CommandFunction] = {}
+    arg_adder, command = app_args(lambda: cmds, table)
+    parser = ArgumentParser()
+    arg_adder(parser)
+    assert table == {"a": command_function}
+    assert command(parser.parse_args(["a"])) == 0
@@ -8,7 +8,7 @@ from argparse import ArgumentParser
 from os import linesep
 
 # module under test
-from vcorelib.args.newline import add_newline_arg
+from vcorelib.args.newline import LineEnding, add_newline_arg
 
 
 def test_args_newline_basic():
@@ -28,3 +28,9 @@ def test_args_newline_basic():
 
     args = parser.parse_args(["--line-ending", "platform"])
     assert args.line_ending == linesep
+
+    assert LineEnding.from_arg("DOS") is LineEnding.DOS
+    assert LineEnding.from_arg("anything") is LineEnding.PLATFORM
+
+    assert str(LineEnding.UNIX) == "unix"
+    assert str(LineEnding.DOS) == "dos"
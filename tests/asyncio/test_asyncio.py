@@ -15,7 +15,7 @@ import time
 from typing import Callable
 
 # third-party
-from pytest import mark, raises
+from pytest import importorskip, mark, raises
 
 # internal
 from tests.asyncio.interrupt_tester import task_runner
@@ -23,9 +23,17 @@ from tests.asyncio.interrupt_tester import task_runner
 # module under test
 from vcorelib import PKG_NAME
 from vcorelib.asyncio import (
+    SIGNAL_NAMES,
+    add_interrupt_handler,
+    all_stop_signals,
+    event_setter,
+    log_exceptions,
     log_task_exception,
+    new_eloop,
     normalize_eloop,
     run_handle_stop,
+    shutdown_loop,
+    uvloop_module,
 )
 from vcorelib.paths.context import linked_to
 
@@ -142,3 +150,111 @@ async def test_log_task_exception():
     with raises(ValueError):
         await task
     log_task_exception(task)
+
+
+def test_shutdown_loop_basic():
+    """Test that shutting down a loop cancels its remaining tasks."""
+
+    async def raiser() -> None:
+        """Raise an exception when cancelled."""
+        try:
+            await asyncio.sleep(60.0)
+        except asyncio.CancelledError as exc:
+            raise ValueError("cancelled") from exc
+
+    eloop = asyncio.new_event_loop()
+    tasks = [eloop.create_task(asyncio.sleep(60.0)) for _ in range(3)]
+    tasks.append(eloop.create_task(raiser()))
+
+    # Let the tasks start.
+    eloop.run_until_complete(asyncio.sleep(0))
+
+    shutdown_loop(eloop)
+    assert all(x.done() for x in tasks)
+    assert all(x.cancelled() for x in tasks[:3])
+    assert isinstance(tasks[3].exception(), ValueError)
+    eloop.close()
+
+
+def test_new_eloop_uvloop():
+    """Test that new event loops use uvloop when it's available."""
+
+    uvloop = importorskip("uvloop")
+    assert uvloop_module() is sys.modules["uvloop"]
+
+    eloop = new_eloop(set_current=False)
+    assert isinstance(eloop, uvloop.Loop)
+    eloop.close()
+
+    eloop = new_eloop(set_current=False, enable_uvloop=False)
+    assert not isinstance(eloop, uvloop.Loop)
+    eloop.close()
+
+
+@mark.asyncio
+async def test_log_exceptions_basic():
+    """Test that finished tasks are logged and pending ones are returned."""
+
+    async def raiser() -> None:
+        """Raise an exception."""
+        raise ValueError("Expected.")
+
+    done = asyncio.create_task(asyncio.sleep(0))
+    await done
+    failed = asyncio.create_task(raiser())
+    with raises(ValueError):
+        await failed
+    pending = asyncio.create_task(asyncio.sleep(60.0))
+
+    # Single-pass iterables are supported.
+    assert log_exceptions(iter([done, failed, pending])) == [pending]
+
+    pending.cancel()
+    with suppress(asyncio.CancelledError):
+        await pending
+
+
+@mark.asyncio
+async def test_event_setter_basic():
+    """Test that signal handlers set the stop event."""
+
+    assert SIGNAL_NAMES[signal.SIGINT] == "SIGINT"
+    assert signal.SIGTERM in all_stop_signals()
+    assert all_stop_signals() is all_stop_signals()
+
+    stop_sig = asyncio.Event()
+    event_setter(stop_sig)(signal.SIGINT, None)
+    await asyncio.wait_for(stop_sig.wait(), 1.0)
+
+
+def test_add_interrupt_handler_basic():
+    """Test handling interrupts with an event loop callback."""
+
+    eloop = asyncio.new_event_loop()
+    if add_interrupt_handler(eloop, lambda: None):
+        assert eloop.remove_signal_handler(signal.SIGINT)
+    eloop.close()
+
+
+def test_add_interrupt_handler_existing():
+    """Test that an existing interrupt handler is left in place."""
+
+    async def task() -> bool:
+        """A sample task."""
+        return True
+
+    eloop = asyncio.new_event_loop()
+    eloop.add_signal_handler(signal.SIGINT, lambda: None)
+
+    assert not add_interrupt_handler(eloop, lambda: None)
+    assert (
+        run_handle_stop(
+            asyncio.Event(), task(), eloop=eloop, enable_uvloop=False
+        )
+        is True
+    )
+
+    # The original handler should still be registered.
+    assert eloop.remove_signal_handler(signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+    eloop.close()
@@ -67,3 +67,42 @@ async def test_asyncio_repeat_until_basic():
     event.set()
     for task in tasks:
         assert await task
+
+
+@mark.asyncio
+async def test_asyncio_repeat_until_period():
+    """Test that a task is polled repeatedly until the timeout."""
+
+    calls = 0
+
+    def counter() -> None:
+        """Count calls."""
+        nonlocal calls
+        calls += 1
+
+    assert not await repeat_until(counter, asyncio.Event(), 0.01, 0.1)
+    assert 1 < calls <= 11
+
+    # Without a period, the task is polled as often as possible.
+    calls = 0
+    assert not await repeat_until(counter, asyncio.Event(), 0.0, 0.05)
+    assert calls > 11
+
+
+@mark.asyncio
+async def test_asyncio_repeat_until_raises():
+    """
+    Test that a polled task raising an exception stops polling, but isn't
+    propagated to the caller.
+    """
+
+    calls = 0
+
+    def raiser() -> None:
+        """Raise an exception."""
+        nonlocal calls
+        calls += 1
+        raise ValueError("test")
+
+    assert not await repeat_until(raiser, asyncio.Event(), 0.01, 0.1)
+    assert calls == 1
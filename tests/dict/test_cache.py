@@ -6,6 +6,9 @@ Test the 'dict.cache' module.
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
+# third-party
+from pytest import mark, raises
+
 # module under test
 from vcorelib.dict.cache import DirectoryCache, FileCache, JsonCache
 from vcorelib.io.types import DEFAULT_DATA_EXT
@@ -40,3 +43,23 @@ def test_dict_directory_cache_basic():
 
     with TemporaryDirectory() as tmpdir:
         cache_test(DirectoryCache(tmpdir))
+
+
+@mark.asyncio
+async def test_dict_file_cache_async():
+    """Test that we can use a file cache from an event loop."""
+
+    with TemporaryDirectory() as tmpdir:
+        cache = FileCache(Path(tmpdir, f"cache.{DEFAULT_DATA_EXT}"))
+
+        async with cache.loaded_async() as data:
+            data["a"] = {"a": 1}
+
+        # Data isn't written back if the context raises.
+        with raises(RuntimeError):
+            async with cache.loaded_async() as data:
+                data["b"] = {"b": 1}
+                raise RuntimeError()
+
+        async with cache.loaded_async() as data:
+            assert data == {"a": {"a": 1}}
@@ -45,6 +45,7 @@ def test_dict_codec_basic():
     assert valid.asdict()["a"] == 42
 
     assert str(valid)
+    assert valid == valid  # pylint: disable=comparison-with-itself
 
     assert valid == codec.BasicDictCodec.decode(
         resource("test.json"), schemas=get_test_schemas()
@@ -56,6 +57,10 @@ def test_dict_codec_basic():
     valid.encode(name)
     Path(name).unlink()
 
+    assert codec.BasicDictCodec({"a": 1}) == {"a": 1}
+    assert codec.BasicDictCodec({"a": 1}) != codec.BasicDictCodec({"a": 2})
+    assert str(codec.BasicDictCodec({"a": 1})) == str({"a": 1})
+
     assert codec.BasicDictCodec()
 
     # Test copying.
@@ -5,6 +5,9 @@ Test the 'dict.config' module.
 # built-in
 from os.path import join
 
+# third-party
+from pytest import raises
+
 # internal
 from tests.resources import resource
 
@@ -17,6 +20,8 @@ def test_dict_config_basic():
 
     config = Config({"a": 1})
     assert config["a"] == 1
+    with raises(AssertionError):
+        config["a"]  # pylint: disable=pointless-statement
     assert config.get("b") is None
     config.set_if_not("a", 2)
     assert config["a"] == 2
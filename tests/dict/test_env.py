@@ -21,6 +21,10 @@ def test_resolve_env_vars():
 
     environ["TEST"] = "test"
     assert str_resolve_env_var("$TEST") == "test"
+    assert str_resolve_env_var("  $TEST ") == "test"
+    assert str_resolve_env_var(" TEST") == " TEST"
+    assert str_resolve_env_var("") == ""
+    assert str_resolve_env_var("$a", env={"a": ""}) == "$a"
     assert list_resolve_env_vars(["$TEST", ["$TEST"], {"$TEST": "$TEST"}]) == [
         "test",
         ["test"],
@@ -34,3 +38,37 @@ def test_resolve_env_vars():
     assert list_resolve_env_vars(
         ["$a", "$b", "$c"], env={"a": "1", "b": "2", "c": "3"}
     ) == ["1", "2", "3"]
+
+    # Keys and values can be resolved independently.
+    env = {"a": "1", "b": "2"}
+    assert dict_resolve_env_vars(
+        {"$a": "$b", "c": {"$b": ["$a"]}}, values=False, env=env
+    ) == {"1": "$b", "c": {"2": ["1"]}}
+    assert dict_resolve_env_vars(
+        {"$a": "$b", "c": {"$b": ["$a"]}}, keys=False, env=env
+    ) == {"$a": "2", "c": {"$b": ["1"]}}
+
+    # Deeply nested data doesn't hit the recursion limit.
+    root: list = []
+    inner = root
+    for _ in range(5000):
+        inner.append({"$a": []})
+        inner = inner[-1]["$a"]
+    inner.append("$b")
+
+    list_resolve_env_vars(root, env=env)
+    for _ in range(5000):
+        root = root[-1]["1"]
+    assert root == ["2"]
+
+    # Cyclic data is resolved once per container.
+    cyclic: dict = {"$a": "$b"}
+    cyclic["self"] = cyclic
+    cyclic["list"] = [cyclic, "$a"]
+    cyclic["list"].append(cyclic["list"])
+
+    assert dict_resolve_env_vars(cyclic, env=env) is cyclic
+    assert cyclic["1"] == "2"
+    assert cyclic["self"] is cyclic
+    assert cyclic["list"][1] == "1"
+    assert cyclic["list"][2] is cyclic["list"]
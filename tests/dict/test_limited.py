@@ -16,3 +16,7 @@ def test_limited_basic():
 
     with limited(data, "b"):
         assert "b" not in data
+
+    with limited(data, "b", 3):
+        assert data["b"] == 3
+    assert data == {"a": 1}
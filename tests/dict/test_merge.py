@@ -31,6 +31,9 @@ def test_merge_bad_overwrite():
 def test_merge_update():
     """Test the 'update' strategy of dictionary merges."""
     assert merge({"a": 1}, {"a": 2}, strategy=MergeStrategy.UPDATE) == {"a": 2}
+    assert merge_dicts(
+        [{"a": 1, "b": 1}, {"a": 2}, {"c": 3}], strategy=MergeStrategy.UPDATE
+    ) == {"a": 2, "b": 1, "c": 3}
 
 
 def test_merge_basic():
@@ -58,3 +61,19 @@ def test_merge_basic():
         "b": 1,
         "c": 3,
     }
+
+
+def test_merge_nested():
+    """Test merging nested dictionaries."""
+
+    dict_a: GenericDict = {"a": {"b": {"c": [1], "d": 1}, "e": 1}, "f": 1}
+    dict_b: GenericDict = {"a": {"b": {"c": [2], "d": 2, "g": 1}}, "f": 2}
+
+    assert merge(deepcopy(dict_a), dict_b) == {
+        "a": {"b": {"c": [1, 2], "d": 1, "g": 1}, "e": 1},
+        "f": 1,
+    }
+    assert merge(dict_a, dict_b, path=["root"], expect_overwrite=True) == {
+        "a": {"b": {"c": [1, 2], "d": 2, "g": 1}, "e": 1},
+        "f": 2,
+    }
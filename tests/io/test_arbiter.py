@@ -3,6 +3,7 @@ Test the 'DataArbiter' class.
 """
 
 # built-in
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -98,15 +99,31 @@ def test_arbiter_decode_failures():
 def test_arbiter_decode_directory_recurse():
     """Ensure we can successfully recurse a directory."""
 
-    assert ARBITER.decode_directory(
-        resource("simple_decode").joinpath("recurse"),
-        require_success=True,
-        recurse=True,
-    ).data == {
+    expected = {
         "a_section_1": {"a": "a", "b": "b", "c": "c"},
         "b_section_1": {"a": "a", "b": "b", "c": "c"},
         "c_section_1": {"a": "a", "b": "b", "c": "c"},
     }
+    assert (
+        ARBITER.decode_directory(
+            resource("simple_decode").joinpath("recurse"),
+            require_success=True,
+            recurse=True,
+        ).data
+        == expected
+    )
+
+    # Files can also be decoded concurrently.
+    with ThreadPoolExecutor() as executor:
+        assert (
+            ARBITER.decode_directory(
+                resource("simple_decode").joinpath("recurse"),
+                require_success=True,
+                recurse=True,
+                executor=executor,
+            ).data
+            == expected
+        )
 
 
 def test_arbiter_decode_includes():
@@ -135,3 +152,16 @@ def test_arbiter_decode_includes_left():
         "b": [2, 0, 1],
         "c": [2, 0, 1],
     }
+
+
+def test_arbiter_decode_json_fallback():
+    """Verify that JSON the standard library accepts can still be loaded."""
+
+    with tempfile(suffix=".json") as tfile:
+        tfile.write_text('{"a": NaN, "b": [1, 2]}', encoding="utf-8")
+        data = ARBITER.decode(tfile, require_success=True).data
+        assert data["b"] == [1, 2]
+        assert data["a"] != data["a"]
+
+        tfile.write_text('{"a": }', encoding="utf-8")
+        assert not ARBITER.decode(tfile)
@@ -3,7 +3,7 @@ vcorelib - Test the 'logging' module.
 """
 
 # internal
-from logging import LoggerAdapter, getLogger
+from logging import INFO, WARNING, LoggerAdapter, getLogger
 
 # module under test
 from vcorelib.logging import LoggerMixin, log_time, normalize, queue_handler
@@ -14,9 +14,14 @@ def test_log_time_basic():
     """Test that log_time works in a simple scenario."""
 
     log = getLogger(__name__)
-    with log_time(log, "Example"):
-        for _ in range(100):
-            pass
+    log.setLevel(INFO)
+    with log_time(log, "Example", reminder=True):
+        pass
+
+    # Nothing is timed or logged when the level isn't enabled.
+    log.setLevel(WARNING)
+    with log_time(log, "Example", reminder=True):
+        pass
 
 
 def test_log_queue_handler():
@@ -2,6 +2,9 @@
 vcorelib - Test the 'math.time' module.
 """
 
+# built-in
+from concurrent.futures import ThreadPoolExecutor
+
 # module under test
 from vcorelib.math import (
     BILLION,
@@ -15,6 +18,7 @@ from vcorelib.math import (
     set_simulated_source,
     simulated_time,
 )
+from vcorelib.math.time import Timer
 
 
 def test_simulated_time_basic():
@@ -97,3 +101,20 @@ def test_rate_str_basic():
     """Test the 'rate_str' method."""
 
     assert rate_str(1.0) == "1 Hz (1s)"
+
+
+def test_timer_threads():
+    """Test that measurements from multiple threads get unique tokens."""
+
+    timer = Timer()
+
+    def measure(_: int) -> int:
+        with timer.measure_ns() as token:
+            pass
+        return token
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tokens = list(executor.map(measure, range(1000)))
+
+    assert len(set(tokens)) == 1000
+    assert all(timer.result(token) >= 0 for token in tokens)
@@ -3,12 +3,16 @@ Tests for the 'paths' module.
 """
 
 # built-in
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from logging import getLogger
 from os import linesep, sep
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import sleep
 
+# third-party
+from pytest import raises, skip
+
 # internal
 from tests.resources import get_archives_root, resource
 
@@ -18,6 +22,7 @@ from vcorelib.io.types import FileExtension
 from vcorelib.paths import (
     file_hash_hex,
     file_md5_hex,
+    files_md5_hex,
     find_file,
     get_file_name,
     modified_after,
@@ -29,8 +34,10 @@ from vcorelib.paths import (
     stats,
     str_hash_hex,
     str_md5_hex,
+    write_lines,
 )
 from vcorelib.paths.context import as_path, in_dir, tempfile
+from vcorelib.paths.find import package_search_path
 from vcorelib.platform import is_windows
 
 
@@ -38,6 +45,8 @@ def test_file_name_ext():
     """Test various file name to extention conversions."""
 
     assert FileExtension.from_path("test") is None
+    assert FileExtension.from_path("a.unknown") is None
+    assert FileExtension.from_ext("yml") is FileExtension.YAML
 
     assert FileExtension.from_path("json") is FileExtension.JSON
     assert FileExtension.from_path("a.json") is FileExtension.JSON
@@ -73,10 +82,24 @@ def test_md5_hex():
         else "d8e8fca2dc0f896fd7cb4cb0031ba249"
     )
     assert file_md5_hex(resource("test.txt")) == expect
+    hashes = {
+        resource("test.txt"): expect,
+        resource("test.json"): file_md5_hex(resource("test.json")),
+    }
+    assert files_md5_hex(hashes) == hashes
+    with ThreadPoolExecutor() as executor:
+        assert files_md5_hex(hashes, executor) == hashes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert files_md5_hex(hashes, executor, chunksize=2) == hashes
 
     # Verify we can assert that files exist.
     assert normalize(resource("scripts"), "test.py", require=True)
 
+    # Paths created from strings are shared, existence is checked every time.
+    assert normalize("a", "b") == normalize("a/b") == Path("a", "b")
+    with raises(AssertionError):
+        normalize("not_a_real_path", require=True)
+
 
 def test_hash_hex():
     """Test various hashing wrapper methods."""
@@ -104,6 +127,7 @@ def test_find_file():
     assert find_file("valid", package="tests", logger=logger)
     assert find_file("valid", "scripts", package="tests", logger=logger)
     assert find_file("valid", "test.txt", package="tests", logger=logger)
+    assert package_search_path("tests") is package_search_path("tests")
     assert (
         find_file(
             "valid",
@@ -123,6 +147,8 @@ def test_file_stats_basic():
     path = resource("test.txt")
     assert stats(path) is not None
     assert modified_ns(path)
+    assert stats(path.joinpath("missing")) is None
+    assert modified_ns("missing.txt") is None
 
     with TemporaryDirectory() as _tmpdir:
         tmpdir = Path(_tmpdir)
@@ -141,11 +167,7 @@ def test_file_stats_basic():
         sleep(0.01)
 
         # Write to the second file.
-        with second_file.open("w", encoding="utf-8") as path_fd:
-            for i in range(1000):
-                path_fd.write(str(i))
-                path_fd.write(linesep)
-            path_fd.flush()
+        write_lines(second_file, map(str, range(1000)))
 
         assert modified_after(first_file, [second_file])
         assert not modified_after(second_file, [first_file])
@@ -164,6 +186,43 @@ def test_file_stats_basic():
         assert modified_after(tmpdir.joinpath("test3.txt"), [first_file])
         assert modified_after(tmpdir.joinpath("test4.txt"), [second_file])
 
+        # Candidates that don't exist are never more recent.
+        missing = str(tmpdir.joinpath("test5.txt"))
+        assert not modified_after(missing, [missing])
+        assert not modified_after(second_file, [missing])
+
+        # Candidates after the first more recent one aren't checked.
+        remaining = iter([str(second_file), missing, missing])
+        assert modified_after(first_file, remaining)
+        assert list(remaining) == [missing, missing]
+
+        # Candidates can be checked in parallel.
+        with ThreadPoolExecutor() as executor:
+            candidates = [missing, str(first_file), str(second_file)]
+            assert modified_after(first_file, candidates, executor)
+            assert not modified_after(second_file, candidates, executor)
+
+
+def test_file_stats_symlink_loop():
+    """Test that paths within a symbolic-link loop don't exist."""
+
+    with TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        loop = tmpdir.joinpath("a")
+        try:
+            loop.symlink_to(tmpdir.joinpath("b"))
+            tmpdir.joinpath("b").symlink_to(loop)
+        except OSError:  # pragma: no cover
+            skip("Can't create symbolic links.")
+
+        assert stats(loop) is None
+        assert modified_ns(loop) is None
+
+        path = tmpdir.joinpath("test.txt")
+        path.touch()
+        assert not modified_after(path, [loop])
+        assert modified_after(loop, [path])
+
 
 def test_prune_empty_directories():
     """Test pruning empty directories."""
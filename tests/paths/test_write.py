@@ -0,0 +1,31 @@
+"""
+Test the 'paths.write' module.
+"""
+
+# module under test
+from vcorelib.paths import fast_write_bytes, write_lines
+from vcorelib.paths.context import tempfile
+
+
+def test_fast_write_bytes_basic():
+    """Test that we can write bytes to a file."""
+
+    with tempfile() as path:
+        path.write_bytes(b"existing contents")
+
+        assert fast_write_bytes(path, b"test") == 4
+        assert path.read_bytes() == b"test"
+
+        assert fast_write_bytes(str(path), b"") == 0
+        assert path.read_bytes() == b""
+
+
+def test_write_lines_basic():
+    """Test that we can write lines of text to a file."""
+
+    with tempfile() as path:
+        assert write_lines(path, ["a", "b"], line_ending="\r\n") == 6
+        assert path.read_bytes() == b"a\r\nb\r\n"
+
+        assert write_lines(path, []) == 0
+        assert path.read_bytes() == b""
@@ -11,7 +11,8 @@ from tests.resources import get_test_schemas
 # module under test
 from vcorelib.dict.codec import BasicDictCodec
 from vcorelib.schemas import CerberusSchema, CerberusSchemaMap
-from vcorelib.schemas.base import SchemaValidationError
+from vcorelib.schemas.base import SCHEMA_CACHE_SIZE, SchemaValidationError
+from vcorelib.schemas.json import VALIDATORS, JsonSchema
 
 
 def test_json_schema_map_basic():
@@ -28,6 +29,18 @@ def test_json_schema_map_basic():
     with raises(SchemaValidationError):
         schemas["A"](5)
 
+    # Validators are shared between identical schemas.
+    assert JsonSchema(schemas["B"].data).validator is schemas["B"].validator
+
+    # Schemas that can't be serialized (e.g. mixed key types) still work.
+    mixed = JsonSchema({"type": "string", 1: "a"})  # type: ignore
+    assert mixed("hello") == "hello"
+
+    # Only a bounded number of validators are kept.
+    for idx in range(SCHEMA_CACHE_SIZE + 1):
+        JsonSchema({"type": "string", "maxLength": idx})
+    assert len(VALIDATORS) == SCHEMA_CACHE_SIZE
+
 
 class A(BasicDictCodec):  # pylint: disable=invalid-name
     """A test class."""
@@ -44,6 +57,10 @@ def test_json_schema_mixin_basic():
 
     assert B.create().data == {"a": 42}
 
+    # Schemas are resolved once per class.
+    assert B.resolve_schema(get_test_schemas()) is B.create().schema
+    assert A.resolve_schema(get_test_schemas()) is not B.create().schema
+
 
 def test_json_schema_references():
     """Test that we can resolve schema references."""
@@ -62,6 +79,24 @@ def test_cerberus_schema_basic():
     schema = CerberusSchema({"name": {"type": "string"}})
     assert schema({"name": "test"}) == {"name": "test"}
 
+    # Schema definitions are shared between identical schemas, but each
+    # schema has its own validator.
+    other = CerberusSchema({"name": {"type": "string"}})
+    assert other.validator is not schema.validator
+    assert other.validator.schema is schema.validator.schema
+    assert (
+        CerberusSchema(
+            {"name": {"type": "string"}}, allow_unknown=True
+        ).validator.schema
+        is not schema.validator.schema
+    )
+
+    # Schemas that can't be serialized (e.g. with callables) still work.
+    coerced = CerberusSchema(
+        {"a": {"type": "integer", "coerce": int}}  # type: ignore
+    )
+    assert coerced({"a": "1"}) == {"a": 1}
+
     # Verify that we raise an exception.
     with raises(SchemaValidationError):
         assert schema({"name": 5})
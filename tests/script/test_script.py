@@ -3,13 +3,15 @@ Test the 'script' module.
 """
 
 # built-in
+from os import utime
 from os.path import join
 
 # internal
 from tests.resources import resource
 
 # module under test
-from vcorelib.script import invoke_script
+from vcorelib.paths.context import linked_to, tempfile
+from vcorelib.script import MODULES, invoke_script, load_script
 from vcorelib.task.manager import TaskManager
 
 
@@ -18,8 +20,50 @@ def test_invoke_script_basic():
 
     script = resource(join("scripts", "test.py"))
     assert invoke_script(script, "test", 1, 2, 3, four=4, five=5, six=6) == 21
+    assert load_script(script) is load_script(str(script))
 
     script_obj = TaskManager()
     assert script_obj.script(script, "test_obj", "a") == 0
     assert script_obj.invoked(script)
     assert script_obj.execute(["a"]) == set()
+
+
+def test_load_script_edited():
+    """Test that a script is loaded again after it's edited."""
+
+    with tempfile(suffix=".py") as path:
+        path.write_text("def value():\n    return 1\n", encoding="utf-8")
+        utime(path, ns=(0, 1))
+        assert invoke_script(path, "value") == 1
+
+        # Module-level state persists while the script is unchanged.
+        assert load_script(path) is load_script(path)
+
+        path.write_text("def value():\n    return 22\n", encoding="utf-8")
+        utime(path, ns=(0, 2))
+        assert invoke_script(path, "value") == 22
+
+        # Edits that don't change the modification time are still detected.
+        path.write_text("def value():\n    return 333\n", encoding="utf-8")
+        utime(path, ns=(0, 2))
+        assert invoke_script(path, "value") == 333
+
+        # Only the latest version of the script is kept.
+        assert MODULES[str(path.resolve())][0] == (2, path.stat().st_size)
+        del MODULES[str(path.resolve())]
+
+
+def test_load_script_link():
+    """Test that a script loaded through a link keeps the given path."""
+
+    with tempfile(suffix=".py") as script, tempfile(suffix=".py") as temp:
+        script.write_text("VALUE = 1\n", encoding="utf-8")
+
+        with linked_to(temp, script) as path:
+            module = load_script(path)
+            assert module.__file__ == str(path)
+
+            # The link and the script it points to share a module.
+            assert load_script(script) is module
+
+        del MODULES[str(script.resolve())]
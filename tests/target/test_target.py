@@ -2,6 +2,9 @@
 Test the 'target' module.
 """
 
+# third-party
+from pytest import raises
+
 # module under test
 from vcorelib.target import Target
 
@@ -28,6 +31,10 @@ def test_target_basic():
     assert int(match_data.get("b")) == 2
     assert int(match_data.get("c")) == 3
     assert target.evaluate("a:1,b:2,c:3,d:4").matched is False
+    assert match_data.substitutions == {"a": "1", "b": "2", "c": "3"}
+
+    with raises(KeyError):
+        Target("test").evaluate("test").get("test")
 
 
 def test_target_compile():
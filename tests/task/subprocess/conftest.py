@@ -0,0 +1,51 @@
+"""
+Fixtures for the 'task.subprocess' tests.
+"""
+
+# built-in
+from shutil import which
+from unittest.mock import AsyncMock, MagicMock
+
+# third-party
+from pytest import MonkeyPatch, fixture
+
+
+def fake_process(returncode: int = 0) -> MagicMock:
+    """Create an object that behaves like a completed asyncio process."""
+
+    proc = MagicMock()
+    proc.pid = 0
+    proc.returncode = returncode
+    proc.communicate = AsyncMock(return_value=(b"", b""))
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+async def fake_exec(program: str, *_args, **_kwargs) -> MagicMock:
+    """A stand-in for 'asyncio.create_subprocess_exec'."""
+
+    # Preserve the failure mode for programs that can't be found.
+    if which(program) is None:
+        raise FileNotFoundError(program)
+    return fake_process()
+
+
+async def fake_shell(_cmd: str, **_kwargs) -> MagicMock:
+    """A stand-in for 'asyncio.create_subprocess_shell'."""
+    return fake_process()
+
+
+@fixture(autouse=True)
+def fake_subprocess(request, monkeypatch: MonkeyPatch) -> None:
+    """
+    Don't spawn real processes unless a test is marked as an integration
+    test.
+    """
+
+    if request.node.get_closest_marker("integration") is None:
+        monkeypatch.setattr(
+            "vcorelib.asyncio.subprocess.create_subprocess_exec", fake_exec
+        )
+        monkeypatch.setattr(
+            "vcorelib.asyncio.cli.create_subprocess_shell", fake_shell
+        )
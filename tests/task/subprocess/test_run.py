@@ -35,23 +35,42 @@ async def test_task_subprocess_run_exec_basic():
     assert task.outbox["code"] == 0
 
 
+@pytest.mark.parametrize(
+    "task_cls",
+    [
+        SubprocessExec,
+        SubprocessShell,
+        SubprocessExecStreamed,
+        SubprocessShellStreamed,
+    ],
+)
 @pytest.mark.asyncio
-async def test_task_subprocess_run_shell_basic():
-    """Test that we can run a basic shell command."""
+async def test_task_subprocess_run_dispatch(task_cls):
+    """Test that each subprocess task kind can be dispatched."""
 
-    task = SubprocessShell("test")
+    task = task_cls("test")
     await task.dispatch()
     assert task.outbox["code"] == 0
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "task_cls",
+    [
+        SubprocessExec,
+        SubprocessShell,
+        SubprocessExecStreamed,
+        SubprocessShellStreamed,
+    ],
+)
 @pytest.mark.asyncio
-async def test_task_subprocess_run_streamed_basic():
-    """Test streamed versions of subprocess and shell command tasks."""
+async def test_task_subprocess_run_integration(task_cls):
+    """Test that real processes are created and waited on."""
 
-    task = SubprocessExecStreamed("test")
+    task = task_cls("test")
     await task.dispatch()
     assert task.outbox["code"] == 0
 
-    new_task = SubprocessShellStreamed("test")
-    await new_task.dispatch()
-    assert new_task.outbox["code"] == 0
+    # Output is only captured when it isn't streamed.
+    if task_cls in (SubprocessExec, SubprocessShell):
+        assert task.outbox["stdout"]
@@ -2,8 +2,12 @@
 Test the 'task.manager' module.
 """
 
+# built-in
+import asyncio
+from typing import Type
+
 # third-party
-from pytest import raises
+from pytest import MonkeyPatch, fixture, raises
 
 # module under test
 from vcorelib.task import FailTask, Task, TaskFailed
@@ -12,14 +16,35 @@ from vcorelib.task.subprocess.run import register_http_server_task
 from vcorelib.task.time.sleep import SleepTask
 
 
+@fixture(autouse=True)
+def fast_sleep(monkeypatch: MonkeyPatch) -> None:
+    """
+    Make sleep tasks yield once instead of sleeping (only the name that sleep
+    tasks use is replaced), these tests only verify dependency ordering.
+    """
+
+    async def sleep(*_args, **_kwargs) -> None:
+        """Yield to the event loop without waiting."""
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr("vcorelib.task.time.sleep._sleep", sleep)
+
+
+def create_manager(kind: Type[Task], *args) -> TaskManager:
+    """Create a task manager where 'test' depends on 'a', 'b' and 'c'."""
+
+    manager = TaskManager()
+    manager.register(kind("a", *args))
+    manager.register(kind("b", *args))
+    manager.register(kind("c", *args))
+    manager.register(kind("test", *args), ["a", "b", "c"])
+    return manager
+
+
 def test_task_manager_basic():
     """Test basic interactions with a task manager."""
 
-    manager = TaskManager()
-    manager.register(SleepTask("a", 0.1))
-    manager.register(SleepTask("b", 0.1))
-    manager.register(SleepTask("c", 0.1))
-    manager.register(SleepTask("test", 0.1), ["a", "b", "c"])
+    manager = create_manager(SleepTask, 0.1)
     manager.execute(["test"])
     manager.execute(["test"])
 
@@ -36,11 +61,7 @@ def test_task_manager_basic():
 def test_task_manager_dry_run():
     """Test that tasks behave correctly during 'init_only'."""
 
-    manager = TaskManager()
-    manager.register(Task("a"))
-    manager.register(Task("b"))
-    manager.register(Task("c"))
-    manager.register(Task("test"), ["a", "b", "c"])
+    manager = create_manager(Task)
     manager.execute(["test"], init_only=True)
     assert manager.tasks["test"].resolved("test") is False
 
@@ -54,6 +75,7 @@ def test_task_manager_dynamic():
     manager.register(SleepTask("c", 0.1))
     manager.register(SleepTask("a:{a}", 0.1), ["a", "b", "c"])
     manager.execute(["a:1", "a:2", "a:3"])
+    assert manager.resolve("a:1") is manager.resolve("a:1")
     manager.execute(["a:1"])
     manager.execute(["a:2"])
     manager.execute(["a:3"])
@@ -61,6 +83,7 @@ def test_task_manager_dynamic():
 
     # Verify that we can depend on tasks that aren't resolved yet.
     manager.register(Task("test"), ["a:5", "a:6", "a:7"])
+    assert not manager.resolutions
     manager.execute(["test"])
 
 
@@ -9,20 +9,17 @@ import asyncio
 from pytest import mark, raises
 
 # module under test
-from vcorelib.task import FailTask, Phony, Task, TaskFailed
+from vcorelib.task import FailTask, Inbox, Outbox, Phony, Task, TaskFailed
 
 
-def test_task_basic():
+@mark.asyncio
+async def test_task_basic():
     """Test basic task execution."""
 
-    async def tasks(task: Task) -> None:
-        """Add task dependencies and then dispatch the original task."""
-        task.depend_on_all([Task("b"), Task("c")])
-        await task.dispatch()
-        await task.dispatch()
-
     task_a = Phony("a")
-    asyncio.run(tasks(task_a))
+    task_a.depend_on_all([Task("b"), Task("c")])
+    await task_a.dispatch()
+    await task_a.dispatch()
     assert task_a.times_invoked == 2
 
 
@@ -33,3 +30,26 @@ async def test_task_fail():
     # Ensure that the task fails.
     with raises(TaskFailed):
         await FailTask("test").dispatch(caller=Task("a"))
+
+
+class BarrierTask(Task):
+    """A task that waits for its siblings at a barrier."""
+
+    async def run(self, inbox: Inbox, outbox: Outbox, *args, **kwargs) -> bool:
+        """Wait at the barrier."""
+        await args[0].wait()
+        return True
+
+
+@mark.asyncio
+async def test_task_dependencies_concurrent():
+    """Test that independent dependencies run concurrently."""
+
+    # If dependencies ran one after another, no task would get past the
+    # barrier.
+    barrier = asyncio.Barrier(3)
+    task = Phony("test")
+    task.depend_on_all([BarrierTask(x, barrier) for x in "abc"])
+
+    async with asyncio.timeout(5.0):
+        await task.dispatch()
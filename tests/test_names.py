@@ -2,6 +2,9 @@
 Test the 'names' module.
 """
 
+# third-party
+from pytest import raises
+
 # module under test
 from vcorelib.names import (
     import_str_and_item,
@@ -36,3 +39,7 @@ def test_import_str_and_item_basic():
     """Test basic string manipulation."""
 
     assert import_str_and_item("a.b.c") == ("a.b", "c")
+    assert import_str_and_item("a.b") == ("a", "b")
+
+    with raises(AssertionError):
+        import_str_and_item("a")
@@ -13,6 +13,7 @@ def test_python_methods_basic():
     assert venv_bin(".", program="python")
     assert venv_bin(".", version="3.11")
     assert venv_bin(".", version="3.11", program="python")
+    assert venv_bin(".", "python", "3.11") is venv_bin(None, "python", "3.11")
     assert python_entry()
 
 
@@ -21,3 +22,5 @@ def test_str_to_bool_basic():
 
     assert StrToBool.parse("true").result
     assert StrToBool.parse("false").valid
+    assert StrToBool.parse("FALSE") == (False, True)
+    assert StrToBool.parse("yes") == (False, False)
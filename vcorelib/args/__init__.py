@@ -2,24 +2,31 @@
 A module for working with application-specific argument parsers.
 """
 
+from __future__ import annotations
+
 # built-in
-from argparse import ArgumentParser, Namespace
-from typing import Callable as _Callable
-from typing import Dict as _Dict
-from typing import Sequence as _Sequence
-from typing import Tuple as _Tuple
+from collections.abc import Callable as _Callable
+from collections.abc import Sequence as _Sequence
+from types import MappingProxyType as _MappingProxyType
+from typing import TYPE_CHECKING
+
+# Only import 'argparse' when type checking, applications import it when they
+# actually parse arguments.
+if TYPE_CHECKING:
+    from argparse import ArgumentParser, Namespace
 
-CommandFunction = _Callable[[Namespace], int]
-CommandRegister = _Callable[[ArgumentParser], CommandFunction]
+CommandFunction = _Callable[["Namespace"], int]
+CommandRegister = _Callable[["ArgumentParser"], CommandFunction]
 
-CommandLoader = _Callable[[], _Sequence[_Tuple[str, str, CommandRegister]]]
+CommandLoader = _Callable[[], _Sequence[tuple[str, str, CommandRegister]]]
 
-CMDS: _Dict[str, CommandFunction] = {}
+# The command table used when 'app_args' isn't given one.
+CMDS: dict[str, CommandFunction] = {}
 
 
 def app_args(
-    command_loader: CommandLoader, commands: _Dict[str, CommandFunction] = None
-) -> _Tuple[_Callable[[ArgumentParser], None], CommandFunction]:
+    command_loader: CommandLoader, commands: dict[str, CommandFunction] = None
+) -> tuple[_Callable[[ArgumentParser], None], CommandFunction]:
     """
     Create a function that can be used to add sub-command processing to an
     argument parser.
@@ -28,6 +35,9 @@ def app_args(
     if commands is None:
         commands = CMDS
 
+    # Commands are only dispatched through a read-only view.
+    registered = _MappingProxyType(commands)
+
     def add_app_args(parser: ArgumentParser) -> None:
         """Add application-specific arguments to the command-line parser."""
 
@@ -38,16 +48,12 @@ def app_args(
             help="set of available commands",
         )
         assert commands is not None
-        commands.update(
-            {
-                name: register(subparser.add_parser(name, help=cmd_help))
-                for name, cmd_help, register in command_loader()
-            }
-        )
+        add_parser = subparser.add_parser
+        for name, cmd_help, register in command_loader():
+            commands[name] = register(add_parser(name, help=cmd_help))
 
     def call_command(args: Namespace) -> int:
         """Call the specified command from parsed arguments."""
-        assert commands is not None
-        return commands[args.command](args)
+        return registered[args.command](args)
 
     return add_app_args, call_command
@@ -17,22 +17,18 @@ class LineEnding(str, Enum):
 
     def __str__(self) -> str:
         """Get this enum as a string."""
-        result = "platform"
-        if self is LineEnding.UNIX:
-            result = "unix"
-        if self is LineEnding.DOS:
-            result = "dos"
-        return result
+        return LINE_ENDING_NAMES.get(self, "platform")
 
     @staticmethod
     def from_arg(opt: str) -> "LineEnding":
         """Convert a string option to an instance of this enum."""
-        opt = opt.lower()
-        if opt == "unix":
-            return LineEnding.UNIX
-        if opt == "dos":
-            return LineEnding.DOS
-        return LineEnding.PLATFORM
+        return LINE_ENDING_ARGS.get(opt.lower(), LineEnding.PLATFORM)
+
+
+# String options that select a specific line ending, anything else selects the
+# platform's line ending.
+LINE_ENDING_ARGS = {"unix": LineEnding.UNIX, "dos": LineEnding.DOS}
+LINE_ENDING_NAMES = {value: key for key, value in LINE_ENDING_ARGS.items()}
 
 
 def add_newline_arg(parser: ArgumentParser) -> None:
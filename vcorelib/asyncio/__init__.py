@@ -8,18 +8,20 @@ from __future__ import annotations
 import asyncio as _asyncio
 from contextlib import ExitStack, contextmanager
 from contextlib import suppress as _suppress
+from functools import cache as _cache
 from logging import getLogger as _getLogger
 import signal as _signal
 from types import FrameType as _FrameType
+from types import ModuleType as _ModuleType
 from typing import Any as _Any
 from typing import Awaitable as _Awaitable
 from typing import Callable as _Callable
 from typing import Coroutine as _Coroutine
+from typing import FrozenSet as _FrozenSet
 from typing import Iterable as _Iterable
 from typing import Iterator
 from typing import List as _List
 from typing import Optional as _Optional
-from typing import Set as _Set
 from typing import TypeVar as _TypeVar
 
 # internal
@@ -34,18 +36,23 @@ def log_task_exception(
 ) -> None:
     """If a task is done and raised an exception, log it."""
 
-    if logger is None:
-        logger = LOG
-
     if task.done():
-        with _suppress(_asyncio.CancelledError):
-            exc = task.exception()
-            if (
-                exc is not None
-                and not isinstance(exc, _asyncio.CancelledError)
-                and not isinstance(exc, KeyboardInterrupt)
-            ):
-                logger.exception("Task raised exception:", exc_info=exc)
+        _log_done_exception(task, LOG if logger is None else logger)
+
+
+def _log_done_exception(
+    task: _asyncio.Task[_Any], logger: _LoggerType
+) -> None:
+    """Log a completed task's exception, if it raised one."""
+
+    with _suppress(_asyncio.CancelledError):
+        exc = task.exception()
+        if (
+            exc is not None
+            and not isinstance(exc, _asyncio.CancelledError)
+            and not isinstance(exc, KeyboardInterrupt)
+        ):
+            logger.exception("Task raised exception:", exc_info=exc)
 
 
 def log_exceptions(
@@ -53,15 +60,45 @@ def log_exceptions(
 ) -> _List[_asyncio.Task[T]]:
     """Log task exception and return the list of tasks that aren't complete."""
 
+    if logger is None:
+        logger = LOG
+
+    pending = []
     for task in tasks:
-        log_task_exception(task, logger=logger)
-    return [x for x in tasks if not x.done()]
+        if task.done():
+            _log_done_exception(task, logger)
+        else:
+            pending.append(task)
+    return pending
 
 
-def new_eloop(set_current: bool = True) -> _asyncio.AbstractEventLoop:
-    """Get a new event loop."""
+@_cache
+def uvloop_module() -> _Optional[_ModuleType]:
+    """
+    Get the 'uvloop' module if it's available (this is only determined once).
+    """
+
+    # pylint: disable=import-outside-toplevel
+
+    result = None
+    with _suppress(ImportError):
+        import uvloop
+
+        result = uvloop
+
+    # pylint: enable=import-outside-toplevel
+
+    return result
+
+
+def new_eloop(
+    set_current: bool = True, enable_uvloop: bool = True
+) -> _asyncio.AbstractEventLoop:
+    """Get a new event loop (using uvloop if it's available)."""
+
+    uvloop = uvloop_module() if enable_uvloop else None
+    eloop: _asyncio.AbstractEventLoop = (uvloop or _asyncio).new_event_loop()
 
-    eloop = _asyncio.new_event_loop()
     if set_current:
         _asyncio.set_event_loop(eloop)
     return eloop
@@ -94,10 +131,14 @@ def shutdown_loop(
         for task in tasks:
             task.cancel()
 
-            # Give all tasks a chance to complete.
-            with _suppress(KeyboardInterrupt, _asyncio.CancelledError):
-                eloop.run_until_complete(task)
-                log_task_exception(task, logger=logger)
+        # Give all tasks a chance to complete (together).
+        with _suppress(KeyboardInterrupt, _asyncio.CancelledError):
+            eloop.run_until_complete(
+                _asyncio.gather(*tasks, return_exceptions=True)
+            )
+
+        for task in tasks:
+            log_task_exception(task, logger=logger)
 
 
 def run_handle_interrupt(
@@ -123,6 +164,10 @@ def run_handle_interrupt(
 
 SignalHandler = _Callable[[int, _Optional[_FrameType]], None]
 
+# Names for this platform's signals, so that handlers don't need to create
+# enum instances.
+SIGNAL_NAMES = {int(x): x.name for x in _signal.Signals}
+
 
 def event_setter(
     stop_sig: _asyncio.Event,
@@ -134,29 +179,59 @@ def event_setter(
     if logger is None:
         logger = LOG
 
+    set_stop = stop_sig.set
+
     def setter(sig: int, _: _Optional[_FrameType]) -> None:
         """Set the signal."""
 
-        rep = f"{sig} ({_signal.Signals(sig).name})"
-        LOG.info("Received signal %s.", rep)
+        LOG.info(
+            "Received signal %d (%s).", sig, SIGNAL_NAMES.get(sig, "unknown")
+        )
 
         # Ensure scheduling 'stop_sig.set' is a nominal reaction to this
         # signal.
-        normalize_eloop(eloop).call_soon_threadsafe(stop_sig.set)
+        normalize_eloop(eloop).call_soon_threadsafe(set_stop)
 
     return setter
 
 
-def all_stop_signals() -> _Set[int]:
-    """Get a set of all stop signals on this platform."""
-
-    return {
+# The platform's signal table doesn't change, so this is only built once.
+STOP_SIGNALS: _FrozenSet[int] = frozenset(
+    {
         _signal.SIGINT,
         getattr(_signal, "SIGBREAK", _signal.SIGINT),
         getattr(_signal, "CTRL_C_EVENT", _signal.SIGINT),
         getattr(_signal, "CTRL_BREAK_EVENT", _signal.SIGINT),
         _signal.SIGTERM,
     }
+)
+
+
+def all_stop_signals() -> _FrozenSet[int]:
+    """Get a set of all stop signals on this platform."""
+    return STOP_SIGNALS
+
+
+def add_interrupt_handler(
+    eloop: _asyncio.AbstractEventLoop, callback: _Callable[[], None]
+) -> bool:
+    """
+    Attempt to handle interrupt signals with an event loop callback. Returns
+    False if this isn't supported (e.g. on Windows or outside of the main
+    thread) or if an interrupt handler is already installed.
+    """
+
+    result = False
+
+    # Don't replace (and later remove) a handler that was installed by
+    # someone else.
+    if _signal.getsignal(_signal.SIGINT) is not _signal.default_int_handler:
+        return result
+
+    with _suppress(NotImplementedError, RuntimeError, ValueError):
+        eloop.add_signal_handler(_signal.SIGINT, callback)
+        result = True
+    return result
 
 
 def run_handle_stop(
@@ -171,21 +246,33 @@ def run_handle_stop(
     complete.
     """
 
-    with try_uvloop_runner(eloop=eloop, enable=enable_uvloop) as loop:
+    with ExitStack() as stack:
+        loop = stack.enter_context(
+            try_uvloop_runner(eloop=eloop, enable=enable_uvloop)
+        )
         to_run = loop.create_task(task)
 
+        def interrupt() -> None:
+            """Handle a keyboard interrupt."""
+            print("Keyboard interrupt.")
+            stop_sig.set()
+
         # Register signal handlers if signals were provided.
         if signals is not None:
             setter = event_setter(stop_sig, eloop=loop)
             for signal in signals:
                 _signal.signal(signal, setter)
 
+        # Otherwise, have the event loop handle interrupts directly (where
+        # it's supported) so that they don't interrupt 'run_until_complete'.
+        elif add_interrupt_handler(loop, interrupt):
+            stack.callback(loop.remove_signal_handler, _signal.SIGINT)
+
         while True:
             try:
                 return loop.run_until_complete(to_run)
             except KeyboardInterrupt:
-                print("Keyboard interrupt.")
-                stop_sig.set()
+                interrupt()
 
 
 @contextmanager
@@ -196,25 +283,13 @@ def try_uvloop_runner(
 ) -> Iterator[_asyncio.AbstractEventLoop]:
     """Try to set up an asyncio runner using uvloop."""
 
-    # pylint: disable=import-outside-toplevel
-
     with ExitStack() as stack:
-        if enable and eloop is None:
-            with _suppress(ImportError):
-                import uvloop
-
-                # Try-catch and type ignore can be removed if 3.10 gets
-                # dropped.
-                try:
-                    # type: ignore[attr-defined,unused-ignore]
-                    eloop = stack.enter_context(
-                        getattr(_asyncio, "Runner")(
-                            debug=debug, loop_factory=uvloop.new_event_loop
-                        )
-                    ).get_loop()
-                except AttributeError:  # pragma: nocover
-                    uvloop.install()
+        uvloop = uvloop_module() if enable else None
+        if uvloop is not None and eloop is None:
+            eloop = stack.enter_context(
+                _asyncio.Runner(
+                    debug=debug, loop_factory=uvloop.new_event_loop
+                )
+            ).get_loop()
 
         yield normalize_eloop(eloop)
-
-    # pylint: enable=import-outside-toplevel
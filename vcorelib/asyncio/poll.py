@@ -17,7 +17,8 @@ async def repeat_until(
 ) -> bool:
     """
     Repeat a task until the provided event is set. Returns True if the
-    event triggered this function to clean up and exit.
+    event triggered this function to clean up and exit. If the task raises
+    an exception, polling stops but the exception isn't propagated.
     """
 
     async def poller() -> None:
@@ -27,28 +28,33 @@ async def repeat_until(
 
         do_await = iscoroutinefunction(task)
 
+        # Schedule against a running deadline (instead of sleeping for the
+        # remainder of each period), but don't let a slow task cause a burst
+        # of back-to-back iterations.
+        deadline = eloop.time()
+
         with suppress(asyncio.CancelledError):
             while not event.is_set():
-                start = eloop.time()
-
                 if do_await:
                     await task()  # type: ignore
                 else:
                     task()
 
-                await asyncio.sleep(max(0, period - (eloop.time() - start)))
-
-    poll_task = asyncio.create_task(poller())
+                # Only yield to the event loop if there's no period to wait
+                # for.
+                if period <= 0.0:
+                    await asyncio.sleep(0)
+                    continue
 
-    async def poller_canceller() -> None:
-        """Cancel the poller task when the event is set."""
+                deadline = max(deadline + period, eloop.time())
+                waiter = eloop.create_future()
+                handle = eloop.call_at(deadline, waiter.set_result, None)
+                try:
+                    await waiter
+                finally:
+                    handle.cancel()
 
-        await event.wait()
-        if not poll_task.done():
-            poll_task.cancel()
-            await poll_task
-
-    poller_task = asyncio.create_task(poller_canceller())
+    poll_task = asyncio.create_task(poller())
 
     # Determine if the event was set externally (success) or if this method
     # timed out waiting for it.
@@ -57,8 +63,15 @@ async def repeat_until(
         await asyncio.wait_for(event.wait(), timeout)
         result = event.is_set()
 
-    # Clean up.
+    # Clean up. Only a poller that's still running is cancelled and waited
+    # on (a poller that stopped on its own, e.g. because the task raised, is
+    # left as-is).
     event.set()
-    await poller_task
+    if not poll_task.done():
+        poll_task.cancel()
+
+        # Wait for the poller without raising (it may be cancelled before it
+        # ever starts running).
+        await asyncio.wait((poll_task,))
 
     return result
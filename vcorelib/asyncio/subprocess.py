@@ -24,7 +24,7 @@ def log_process_info(
 
     return (
         str(_rel(program, base=base)),
-        " ".join(str(_rel(x, base=base)) for x in args),
+        " ".join([str(_rel(x, base=base)) for x in args]),
     )
 
 
@@ -3,13 +3,12 @@ Dictionary manipulation utilities.
 """
 
 # built-in
-from contextlib import contextmanager as _contextmanager
 from enum import Enum as _Enum
 from enum import auto as _auto
 from logging import getLogger
 from typing import Any as _Any
+from typing import ContextManager as _ContextManager
 from typing import Dict as _Dict
-from typing import Iterator as _Iterator
 from typing import List as _List
 
 # internal
@@ -19,6 +18,9 @@ _LOG = getLogger(__name__)
 GenericDict = _Dict[_Any, _Any]
 GenericStrDict = _Dict[str, _Any]
 
+# Distinguishes a missing key from one holding None.
+_MISSING = object()
+
 
 def consume(data: GenericDict, key: _Any, default: _Any = None) -> _Any:
     """
@@ -39,34 +41,51 @@ def set_if_not(data: GenericDict, key: _Any, value: _Any = None) -> _Any:
     return data[key]
 
 
-@_contextmanager
-def limited(
-    data: GenericDict, key: _Any, value: _Any = None
-) -> _Iterator[None]:
-    """Ensure that dictionary data is only temporarily added."""
+class _Limited:
+    """A context manager that temporarily adds dictionary data."""
 
-    had_key = False
-    orig_value = None
+    def __init__(self, data: GenericDict, key: _Any, value: _Any) -> None:
+        """Initialize this instance."""
 
-    # Provide the new value.
-    if value is not None:
-        had_key = key in data
-        if had_key:
-            orig_value = data[key]
-        data[key] = value
+        self.data = data
+        self.key = key
+        self.value = value
+        self.had_key = False
+        self.orig_value: _Any = None
+
+    def __enter__(self) -> None:
+        """Provide the new value."""
+
+        data = self.data
+        key = self.key
 
-    # If no value is provided, ensure that this key isn't already present
-    # to prevent ambiguity.
-    else:
-        assert key not in data
+        if self.value is not None:
+            self.had_key = key in data
+            if self.had_key:
+                self.orig_value = data[key]
+            data[key] = self.value
+
+        # If no value is provided, ensure that this key isn't already present
+        # to prevent ambiguity.
+        else:
+            assert key not in data
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Restore the dictionary to its initial state."""
+
+        # Like the original generator-based implementation, leave the data
+        # as-is if an exception was raised.
+        if exc_type is None and self.value is not None:
+            del self.data[self.key]
+            if self.had_key:
+                self.data[self.key] = self.orig_value
 
-    yield
 
-    # Restore the dictionary to its initial state.
-    if value is not None:
-        del data[key]
-        if had_key:
-            data[key] = orig_value
+def limited(
+    data: GenericDict, key: _Any, value: _Any = None
+) -> _ContextManager[None]:
+    """Ensure that dictionary data is only temporarily added."""
+    return _Limited(data, key, value)
 
 
 class MergeStrategy(_Enum):
@@ -78,6 +97,18 @@ class MergeStrategy(_Enum):
     UPDATE = _auto()
 
 
+def _coerce(left_val: _Any, right_val: _Any) -> _Any:
+    """Attempt to convert a value to the type of another value."""
+
+    left_type = type(left_val)
+    if not isinstance(right_val, left_type):
+        try:
+            right_val = left_type(right_val)
+        except ValueError:
+            pass
+    return right_val
+
+
 def merge_recursive(
     dict_a: GenericDict,
     dict_b: GenericDict,
@@ -92,47 +123,56 @@ def merge_recursive(
     the resulting dictionary is cleanly merged.
     """
 
-    if path is None:
-        path = []
-    if logger is None:
-        logger = _LOG
-
-    for key, right_val in dict_b.items():
-        if key not in dict_a:
-            dict_a[key] = right_val
-            continue
-
-        # first try to coerce b's type into a's
-        if not isinstance(right_val, type(dict_a[key])):
-            try:
-                right_val = type(dict_a[key])(right_val)
-            except ValueError:
-                pass
+    log = _LOG if logger is None else logger
 
-        # same leaf value
-        if dict_a[key] == right_val:
-            pass
-        elif isinstance(dict_a[key], dict) and isinstance(right_val, dict):
-            merge(
-                dict_a[key],
-                right_val,
-                path + [str(key)],
-                expect_overwrite,
-                logger,
-                strategy=strategy,
-            )
-        elif isinstance(dict_a[key], list) and isinstance(right_val, list):
-            dict_a[key].extend(right_val)
-        elif not isinstance(right_val, type(dict_a[key])):
-            logger.error("Type mismatch at '%s'", ".".join(path + [str(key)]))
-            logger.error("left:  %s (%s)", type(dict_a[key]), dict_a[key])
-            logger.error("right: %s (%s)", type(right_val), right_val)
-        elif not expect_overwrite:
-            logger.error("Conflict at '%s'", ".".join(path + [str(key)]))
-            logger.error("left:  %s", dict_a[key])
-            logger.error("right: %s", right_val)
+    # Descend into nested dictionaries with an explicit stack of in-progress
+    # iterators (instead of recursion), which visits keys in the same order.
+    stack = [(dict_a, iter(dict_b.items()), tuple(path or ()))]
+    while stack:
+        left, items, prefix = stack[-1]
+
+        for key, right_val in items:
+            left_val = left.get(key, _MISSING)
+            if left_val is _MISSING:
+                left[key] = right_val
+                continue
+
+            # first try to coerce b's type into a's
+            right_val = _coerce(left_val, right_val)
+
+            # same leaf value
+            if left_val == right_val:
+                pass
+            elif isinstance(left_val, dict) and isinstance(right_val, dict):
+                if strategy is MergeStrategy.UPDATE:
+                    left_val.update(right_val)
+                else:
+                    stack.append(
+                        (
+                            left_val,
+                            iter(right_val.items()),
+                            prefix + (str(key),),
+                        )
+                    )
+                    break
+            elif isinstance(left_val, list) and isinstance(right_val, list):
+                left_val.extend(right_val)
+            elif not isinstance(right_val, type(left_val)):
+                log.error(
+                    "Type mismatch at '%s'", ".".join(prefix + (str(key),))
+                )
+                log.error("left:  %s (%s)", type(left_val), left_val)
+                log.error("right: %s (%s)", type(right_val), right_val)
+            elif not expect_overwrite:
+                log.error("Conflict at '%s'", ".".join(prefix + (str(key),)))
+                log.error("left:  %s", left_val)
+                log.error("right: %s", right_val)
+            else:
+                left[key] = right_val
+
+        # This level is complete if its iterator was exhausted.
         else:
-            dict_a[key] = right_val
+            stack.pop()
 
     return dict_a
 
@@ -148,7 +188,7 @@ def merge(
     """Combine two dictionaries based on a provided merge strategy."""
 
     if strategy is MergeStrategy.UPDATE:
-        dict_a.update(dict_b)
+        dict_a |= dict_b
         return dict_a
 
     return merge_recursive(
@@ -173,6 +213,13 @@ def merge_dicts(
     """
 
     result = dicts[0]
+
+    # Updating doesn't need any per-key handling.
+    if strategy is MergeStrategy.UPDATE:
+        for right_dict in dicts[1:]:
+            result |= right_dict
+        return result
+
     for right_dict in dicts[1:]:
         result = merge(
             result,
@@ -4,8 +4,11 @@ A module implementing a JSON-file database.
 
 # built-in
 from abc import ABC, abstractmethod
+from asyncio import to_thread as _to_thread
 from contextlib import ExitStack as _ExitStack
+from contextlib import asynccontextmanager as _asynccontextmanager
 from contextlib import contextmanager as _contextmanager
+from typing import AsyncIterator as _AsyncIterator
 from typing import Iterator as _Iterator
 
 # internal
@@ -39,6 +42,25 @@ class JsonCache(ABC):
         with _ExitStack() as stack:
             yield self.context_load(stack, **kwargs)
 
+    @_asynccontextmanager
+    async def loaded_async(self, **kwargs) -> _AsyncIterator[_JsonObject]:
+        """
+        Provide loaded data (like 'loaded') without blocking the event loop
+        on file I/O.
+        """
+
+        stack = _ExitStack()
+        data = await _to_thread(self.context_load, stack, **kwargs)
+
+        try:
+            yield data
+        except BaseException as exc:
+            # Unwind with the error so that nothing is written back.
+            await _to_thread(stack.__exit__, type(exc), exc, exc.__traceback__)
+            raise
+
+        await _to_thread(stack.close)
+
 
 class FileCache(JsonCache):
     """A class implementing a JSON cache based on a file."""
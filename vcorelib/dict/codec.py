@@ -62,6 +62,9 @@ class JsonCodec(_abc.ABC, SchemaMixin):
     def __eq__(self, other) -> bool:
         """Determine if this instance is equal to another."""
 
+        if other is self:
+            return True
+
         # Allow direct comparison with another dictionary, but not an arbitrary
         # mapping.
         if isinstance(other, dict):
@@ -196,3 +199,29 @@ class BasicDictCodec(DictCodec):
     def asdict(self) -> _JsonObject:
         """Obtain a dictionary representing this instance."""
         return self.data.copy()
+
+    # Read-only operations don't need the copy made by 'asdict'.
+
+    def __str__(self) -> str:
+        """Use this instance's data for string representation."""
+        return str(self.data)
+
+    def __eq__(self, other) -> bool:
+        """Determine if this instance is equal to another."""
+
+        if isinstance(other, BasicDictCodec):
+            other = other.data
+
+        # This is always the case when verifying a new instance.
+        if other is self.data:
+            return True
+
+        if isinstance(other, dict):
+            return self.data == other
+        return super().__eq__(other)
+
+    def encode(
+        self, pathlike: _Pathlike, arbiter: _DataArbiter = _ARBITER, **kwargs
+    ) -> _EncodeResult:
+        """Encode this object instance to a file."""
+        return arbiter.encode(pathlike, self.data, **kwargs)
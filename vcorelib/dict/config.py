@@ -28,8 +28,14 @@ class Config(
 
     def __getitem__(self, key) -> _Any:
         """Consume keys after their data is retreived."""
-        assert key in self.data, f"Key '{key}' not found in configuration!"
-        return _consume(self.data, key)
+
+        # Only look the key up once when it's present.
+        try:
+            return self.data.pop(key)
+        except KeyError:
+            raise AssertionError(
+                f"Key '{key}' not found in configuration!"
+            ) from None
 
     def get(self, key, default=None) -> _Any:
         """Get data from the configuration but allow a default value."""
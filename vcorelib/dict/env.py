@@ -8,6 +8,9 @@ from os import environ as _environ
 from typing import Any as _Any
 from typing import List as _List
 from typing import Mapping as _Mapping
+from typing import Optional as _Optional
+from typing import Set as _Set
+from typing import Union as _Union
 
 # internal
 from vcorelib.dict import GenericDict as _GenericDict
@@ -21,18 +24,102 @@ def str_resolve_env_var(data: str, env: _Mapping[str, _Any] = None) -> str:
     with '$' and is a key in the environment with a non-empty value.
     """
 
+    # Most strings can be ruled out without creating a stripped copy.
+    if not data or (data[0] != "$" and not data[0].isspace()):
+        return data
+
     if env is None:
         env = _environ
 
     temp = data.strip()
     if temp.startswith("$"):
-        key = temp[1:]
-        if key in env and env[key]:
-            data = env[key]
+        value = env.get(temp[1:])
+        if value:
+            data = value
 
     return data
 
 
+def _resolve_list(
+    data: GenericList,
+    stack: _List[_Any],
+    keys: bool,
+    values: bool,
+    lists: bool,
+    env: _Optional[_Mapping[str, str]],
+) -> None:
+    """Resolve list items, adding nested containers to the stack."""
+
+    for idx, item in enumerate(data):
+        if isinstance(item, str):
+            data[idx] = str_resolve_env_var(item, env=env)
+        elif isinstance(item, dict):
+            if keys or values:
+                stack.append(item)
+        elif isinstance(item, list) and lists:
+            stack.append(item)
+
+
+def _resolve_dict(
+    data: _GenericDict,
+    stack: _List[_Any],
+    keys: bool,
+    values: bool,
+    lists: bool,
+    env: _Optional[_Mapping[str, str]],
+) -> None:
+    """Resolve dictionary items, adding nested containers to the stack."""
+
+    # Resolve keys into a new dictionary (instead of changing the size of
+    # data while iterating).
+    result: _GenericDict = {} if keys else data
+
+    for key, value in data.items():
+        if isinstance(value, str):
+            if values:
+                value = str_resolve_env_var(value, env=env)
+        elif isinstance(value, dict) or (isinstance(value, list) and lists):
+            stack.append(value)
+
+        if keys and isinstance(key, str):
+            key = str_resolve_env_var(key, env=env)
+        result[key] = value
+
+    if result is not data:
+        data.clear()
+        data.update(result)
+
+
+def _resolve_env_vars(
+    root: _Union[_GenericDict, GenericList],
+    keys: bool,
+    values: bool,
+    lists: bool,
+    env: _Optional[_Mapping[str, str]],
+) -> None:
+    """
+    Resolve environment-variable substitutions in nested data (in-place) by
+    visiting containers with an explicit stack instead of recursion. Each
+    container is only visited once.
+    """
+
+    stack: _List[_Any] = [root]
+
+    # Resolve each container once, so that cyclic (or shared) data is handled.
+    visited: _Set[int] = set()
+
+    while stack:
+        data = stack.pop()
+        if id(data) in visited:
+            continue
+        visited.add(id(data))
+
+        if isinstance(data, list):
+            _resolve_list(data, stack, keys, values, lists, env)
+        else:
+            _resolve_dict(data, stack, keys, values, lists, env)
+
+
 def list_resolve_env_vars(
     data: GenericList,
     keys: bool = True,
@@ -46,18 +133,7 @@ def list_resolve_env_vars(
     in-place.
     """
 
-    for idx, item in enumerate(data):
-        if isinstance(item, dict) and (keys or values):
-            data[idx] = dict_resolve_env_vars(
-                item, keys, values, lists, env=env
-            )
-        if isinstance(item, list) and lists:
-            data[idx] = list_resolve_env_vars(
-                item, keys, values, lists, env=env
-            )
-        if isinstance(item, str):
-            data[idx] = str_resolve_env_var(item, env=env)
-
+    _resolve_env_vars(data, keys, values, lists, env)
     return data
 
 
@@ -74,31 +150,5 @@ def dict_resolve_env_vars(
     in-place.
     """
 
-    keys_to_remove: _List[str] = []
-    to_update: _GenericDict = {}
-
-    for key, value in data.items():
-        if isinstance(value, str) and values:
-            value = str_resolve_env_var(value, env=env)
-
-        if isinstance(key, str) and keys:
-            to_update[str_resolve_env_var(key, env=env)] = value
-            keys_to_remove.append(key)
-
-        data[key] = value
-
-        if isinstance(value, dict):
-            data[key] = dict_resolve_env_vars(
-                value, keys, values, lists, env=env
-            )
-        if isinstance(value, list) and lists:
-            data[key] = list_resolve_env_vars(
-                value, keys, values, lists, env=env
-            )
-
-    # Don't change the size of data while iterating.
-    for key in keys_to_remove:
-        del data[key]
-    data.update(to_update)
-
+    _resolve_env_vars(data, keys, values, lists, env)
     return data
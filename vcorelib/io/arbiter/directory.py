@@ -3,8 +3,13 @@ A data-arbiter extension for working with directories.
 """
 
 # built-in
+from concurrent.futures import Executor as _Executor
+from functools import partial as _partial
 from pathlib import Path
 from typing import Callable as _Callable
+from typing import List as _List
+from typing import Optional as _Optional
+from typing import Tuple as _Tuple
 from typing import cast as _cast
 
 # internal
@@ -53,6 +58,40 @@ class DataArbiterDirectories(DataArbiterBase):
 
         return success, time_ns
 
+    def _decode_files(
+        self,
+        path: Path,
+        path_filter: _Optional[_Callable[[Path], bool]],
+        executor: _Optional[_Executor],
+        **kwargs,
+    ) -> _List[_Tuple[Path, _Optional[LoadResult]]]:
+        """
+        Decode the files in a directory (possibly concurrently) and pair each
+        directory entry with its result (in directory order).
+        """
+
+        children = list(
+            filter(
+                path_filter if path_filter is not None else lambda _: True,
+                path.iterdir(),
+            )
+        )
+
+        files = [child for child in children if child.is_file()]
+        decode = _partial(self.decode, **kwargs)
+        loads = dict(
+            zip(
+                files,
+                (
+                    map(decode, files)
+                    if executor is None
+                    else executor.map(decode, files)
+                ),
+            )
+        )
+
+        return [(child, loads.get(child)) for child in children]
+
     def decode_directory(
         self,
         pathlike: _Pathlike,
@@ -60,12 +99,15 @@ class DataArbiterDirectories(DataArbiterBase):
         require_success: bool = False,
         path_filter: _Callable[[Path], bool] = None,
         recurse: bool = False,
+        executor: _Executor = None,
         **kwargs,
     ) -> LoadResult:
         """
         Attempt to decode data files in a directory. Assigns data loaded from
         each file to a key, returns whether or not any files failed to load
-        and the cumulative time that each file-load took.
+        and the cumulative time that each file-load took. Files are decoded
+        using 'executor' if one is provided (useful for directories with many
+        files).
         """
 
         data: _JsonObject = {}
@@ -73,25 +115,22 @@ class DataArbiterDirectories(DataArbiterBase):
         errors = 0
         load_time = 0
 
-        for child in filter(
-            path_filter if path_filter is not None else lambda _: True,
-            path.iterdir(),
+        for child, load in self._decode_files(
+            path,
+            path_filter,
+            executor,
+            logger=logger,
+            require_success=require_success,
+            **kwargs,
         ):
-            load = None
-            if child.is_file():
-                load = self.decode(
-                    child,
-                    logger=logger,
-                    require_success=require_success,
-                    **kwargs,
-                )
-            elif recurse and child.is_dir():
+            if load is None and recurse and child.is_dir():
                 load = self.decode_directory(
                     child,
                     logger=logger,
                     require_success=require_success,
                     path_filter=path_filter,
                     recurse=recurse,
+                    executor=executor,
                     **kwargs,
                 )
 
@@ -5,8 +5,12 @@ A module implementing various data-file decoders.
 # built-in
 from configparser import ConfigParser, Error, ExtendedInterpolation
 from json import load
+from json import loads as _json_loads
 from json.decoder import JSONDecodeError
 from logging import getLogger
+from typing import Any as _Any
+from typing import Callable as _Callable
+from typing import Optional as _Optional
 from typing import cast as _cast
 
 # third-party
@@ -26,6 +30,13 @@ from vcorelib.math.time import TIMER as _TIMER
 _LOG = getLogger(__name__)
 _INI_INTERPOLATION = ExtendedInterpolation()
 
+# Use 'orjson' (if it's installed) to parse JSON faster.
+FAST_JSON_LOADS: _Optional[_Callable[[str], _Any]] = None
+try:
+    from orjson import loads as FAST_JSON_LOADS
+except ImportError:  # pragma: no cover
+    pass
+
 
 def decode_ini(
     data_file: _DataStream,
@@ -53,6 +64,23 @@ def decode_ini(
     return LoadResult(_cast(_JsonObject, data), loaded, _TIMER.result(token))
 
 
+def load_json(data_file: _DataStream, **kwargs) -> _Any:
+    """Load JSON data from a text stream."""
+
+    # Keyword arguments are only understood by the standard library.
+    if FAST_JSON_LOADS is None or kwargs:
+        return load(data_file, **kwargs)
+
+    text = data_file.read()
+    try:
+        return FAST_JSON_LOADS(text)
+
+    # Fall back to the standard library for its extensions (e.g. NaN) and
+    # error messages.
+    except JSONDecodeError:
+        return _json_loads(text)
+
+
 def decode_json(
     data_file: _DataStream,
     logger: LoggerType = _LOG,
@@ -65,7 +93,7 @@ def decode_json(
 
     with _TIMER.measure_ns() as token:
         try:
-            data = load(data_file, **kwargs)
+            data = load_json(data_file, **kwargs)
             if not data:
                 data = {}
         except JSONDecodeError as exc:
@@ -94,13 +94,7 @@ class FileExtension(Enum):
     @staticmethod
     def from_ext(ext_str: str) -> _Optional["FileExtension"]:
         """Given a file extension, determine what kind of file it is."""
-
-        result = FileExtension.UNKNOWN
-        for ext in FileExtension:
-            if ext_str in ext.value:
-                result = ext
-                break
-        return None if result is FileExtension.UNKNOWN else result
+        return FILE_EXTENSIONS.get(ext_str)
 
     @staticmethod
     def from_path(
@@ -149,6 +143,15 @@ class FileExtension(Enum):
                 yield from file_ext.candidates(path, exists_only)
 
 
+# A lookup table from extension strings to known file extensions.
+FILE_EXTENSIONS: dict[str, FileExtension] = {
+    ext_str: ext
+    for ext in FileExtension
+    if ext is not FileExtension.UNKNOWN
+    for ext_str in ext.value
+}
+
+
 class LoadResult(NamedTuple):
     """
     An encapsulation of the result of loading raw data, the data collected and
@@ -9,6 +9,7 @@ from logging import INFO as _INFO
 from logging import Logger as _Logger
 from logging import LoggerAdapter as _LoggerAdapter
 from math import floor as _floor
+from threading import Lock as _Lock
 from time import perf_counter_ns as _perf_counter_ns
 from typing import Any as _Any
 from typing import Dict as _Dict
@@ -142,6 +143,7 @@ class Timer:
 
         self.curr: int = 0
         self.data: _Dict[int, int] = {}
+        self.lock = _Lock()
 
     @contextmanager
     def measure_ns(self) -> _Iterator[int]:
@@ -150,8 +152,11 @@ class Timer:
         token that can be used to query for the result afterwards.
         """
 
-        curr = self.curr
-        self.curr += 1
+        # Measurements may be made from multiple threads.
+        with self.lock:
+            curr = self.curr
+            self.curr += 1
+
         start = metrics_time_ns()
         try:
             yield curr
@@ -174,6 +179,11 @@ class Timer:
     ) -> _Iterator[None]:
         """Log how long the caller's context took to execute."""
 
+        # Don't measure anything if nothing would be logged.
+        if not log.isEnabledFor(level):
+            yield
+            return
+
         if reminder:
             log.log(level, message + " is executing.", *args, **kwargs)
 
@@ -42,8 +42,6 @@ def import_str_and_item(module_path: str) -> tuple[str, str]:
     the module in the string preceding it.
     """
 
-    parts = module_path.split(".")
-    assert len(parts) > 1, module_path
-
-    item = parts.pop()
-    return ".".join(parts), item
+    module, sep, item = module_path.rpartition(".")
+    assert sep, module_path
+    return module, item
@@ -3,6 +3,8 @@ Common path manipulation utilities.
 """
 
 # built-in
+from concurrent.futures import Executor as _Executor
+from os import stat as _stat
 from typing import Iterable as _Iterable
 from typing import Optional as _Optional
 
@@ -11,6 +13,7 @@ from vcorelib.paths.base import (
     Pathlike,
     get_file_ext,
     get_file_name,
+    is_missing_error,
     normalize,
     rel,
     set_exec_flags,
@@ -24,10 +27,12 @@ from vcorelib.paths.hashing import (
     create_hex_digest,
     file_hash_hex,
     file_md5_hex,
+    files_md5_hex,
     str_hash_hex,
     str_md5_hex,
     validate_hex_digest,
 )
+from vcorelib.paths.write import fast_write_bytes, write_lines
 
 __all__ = [
     "Pathlike",
@@ -44,6 +49,7 @@ __all__ = [
     "bytes_md5_hex",
     "str_md5_hex",
     "file_md5_hex",
+    "files_md5_hex",
     "set_exec_flags",
     "rel",
     "find_file",
@@ -51,6 +57,8 @@ __all__ = [
     "create_hex_digest",
     "validate_hex_digest",
     "prune_empty_directories",
+    "fast_write_bytes",
+    "write_lines",
 ]
 
 
@@ -64,6 +72,17 @@ def modified_ns(path: Pathlike) -> _Optional[int]:
     return result
 
 
+def _mtime_ns(path: Pathlike) -> int:
+    """Get the last-modified time from a path, or -1 if it doesn't exist."""
+
+    try:
+        return _stat("." if path is None else path).st_mtime_ns
+    except OSError as exc:
+        if not is_missing_error(exc):
+            raise
+        return -1
+
+
 def prune_empty_directories(path: Pathlike) -> None:
     """Attempt to prune empty directories from some path."""
 
@@ -80,26 +99,28 @@ def prune_empty_directories(path: Pathlike) -> None:
             path.rmdir()
 
 
-def modified_after(path: Pathlike, candidates: _Iterable[Pathlike]) -> bool:
+def modified_after(
+    path: Pathlike,
+    candidates: _Iterable[Pathlike],
+    executor: _Executor = None,
+) -> bool:
     """
     Check if any candidate paths are more recently modified than the provided
     path. If the path doesn't exists but one or more of the candidates do, this
-    method returns True.
+    method returns True. Candidates are checked using 'executor' if one is
+    provided (useful for many candidates on slow file systems).
     """
 
-    mtime = modified_ns(path)
-
     # Use zero to compare so that even candidates that exist meet the criteria
-    # for being updated after path.
-    if mtime is None:
-        mtime = 0
-
-    for candidate in candidates:
-        curr_mtime = modified_ns(candidate)
-        if curr_mtime is not None and curr_mtime > mtime:
-            return True
-
-    return False
+    # for being updated after path (candidates that don't exist never do).
+    mtime = max(_mtime_ns(path), 0)
+
+    mtimes = (
+        map(_mtime_ns, candidates)
+        if executor is None
+        else executor.map(_mtime_ns, candidates)
+    )
+    return any(curr_mtime > mtime for curr_mtime in mtimes)
 
 
 # An alias for 'find_file' for convenience.
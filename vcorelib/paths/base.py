@@ -4,6 +4,11 @@ A module implementing common pathing utilities.
 
 # built-in
 from contextlib import suppress as _suppress
+from errno import EBADF as _EBADF
+from errno import ELOOP as _ELOOP
+from errno import ENOENT as _ENOENT
+from errno import ENOTDIR as _ENOTDIR
+from functools import lru_cache as _lru_cache
 from os import stat_result as _stat_result
 from pathlib import Path as _Path
 from typing import Optional as _Optional
@@ -11,17 +16,37 @@ from typing import Union as _Union
 
 Pathlike = _Union[_Path, str, None]
 
+# Errors that mean a path doesn't exist (the same ones that 'pathlib' treats
+# this way, e.g. for 'Path.exists').
+MISSING_ERRNOS = frozenset({_ENOENT, _ENOTDIR, _EBADF, _ELOOP})
+MISSING_WINERRORS = frozenset({21, 123, 1921})
+
+
+def is_missing_error(exc: OSError) -> bool:
+    """Determine if an error means that a path doesn't exist."""
+    return (
+        exc.errno in MISSING_ERRNOS
+        or getattr(exc, "winerror", None) in MISSING_WINERRORS
+    )
+
+
+@_lru_cache(maxsize=1024)
+def _str_path(path: str) -> _Path:
+    """Create a path from a string (paths are immutable, so share them)."""
+    return _Path(path)
+
 
 def normalize(
     path: Pathlike, *parts: _Union[str, _Path], require: bool = False
 ) -> _Path:
     """Normalize an input that could be a path into a path."""
     path = (
-        _Path("." if path is None else path)
+        _str_path("." if path is None else path)
         if not isinstance(path, _Path)
         else path
     )
-    path = path.joinpath(*parts)
+    if parts:
+        path = path.joinpath(*parts)
 
     if require:
         assert path.exists(), f"Path '{path}' doesn't exist!"
@@ -53,9 +78,14 @@ def stats(path: Pathlike) -> _Optional[_stat_result]:
     """Get stats for a file on disk if it exists."""
 
     result = None
-    path = normalize(path)
-    if path.exists():
-        result = path.stat()
+
+    # Checking for existence first would cost a second 'stat' call.
+    try:
+        result = normalize(path).stat()
+    except OSError as exc:
+        if not is_missing_error(exc):
+            raise
+
     return result
 
 
@@ -3,6 +3,7 @@ A module implementing interfaces for finding files.
 """
 
 # built-in
+from functools import cache as _cache
 from pathlib import Path as _Path
 from typing import Callable as _Callable
 from typing import Iterable as _Iterable
@@ -13,6 +14,7 @@ from urllib.parse import urlparse as _urlparse
 
 # third-party
 import importlib_resources as _importlib_resources
+from importlib_resources.abc import Traversable as _Traversable
 
 # internal
 from vcorelib import PKG_NAME
@@ -22,6 +24,17 @@ from vcorelib.paths.base import Pathlike, normalize
 PACKAGE_SEARCH: list[str] = [PKG_NAME]
 
 
+@_cache
+def package_search_path(
+    package: str, package_subdir: str = "data"
+) -> _Traversable:
+    """
+    Get the directory to search for a package's resources (packages can't
+    move once imported, so this is only resolved once per package).
+    """
+    return _importlib_resources.files(package).joinpath(package_subdir)
+
+
 def _populate_package_search_paths(
     to_check: list[Pathlike],
     package: str,
@@ -37,9 +50,7 @@ def _populate_package_search_paths(
         if pkg not in checked:
             try:
                 checked.append(pkg)
-                to_check.append(
-                    _importlib_resources.files(pkg).joinpath(package_subdir)
-                )
+                to_check.append(package_search_path(pkg, package_subdir))
             except ModuleNotFoundError:
                 if logger is not None:
                     logger.warning(
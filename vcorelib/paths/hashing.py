@@ -3,10 +3,14 @@ A module for hashing file data.
 """
 
 # built-in
+from concurrent.futures import Executor as _Executor
+from hashlib import file_digest as _file_digest
 from hashlib import md5 as _md5
 from hashlib import new as _new
 from os import linesep as _linesep
 from pathlib import Path as _Path
+from typing import Dict as _Dict
+from typing import Iterable as _Iterable
 
 # internal
 from vcorelib import DEFAULT_ENCODING as _DEFAULT_ENCODING
@@ -101,7 +105,7 @@ def str_hash_hex(
 def file_hash_hex(path: Pathlike, algorithm: str = DEFAULT_HASH) -> str:
     """Get the hex digest from file data."""
     with normalize(path).open("rb") as stream:
-        return bytes_hash_hex(stream.read(), algorithm=algorithm)
+        return _file_digest(stream, algorithm).hexdigest()
 
 
 def bytes_md5_hex(data: bytes) -> str:
@@ -117,4 +121,23 @@ def str_md5_hex(data: str, encoding: str = _DEFAULT_ENCODING) -> str:
 def file_md5_hex(path: Pathlike) -> str:
     """Get an md5 hex string for a file by path."""
     with normalize(path).open("rb") as stream:
-        return bytes_md5_hex(stream.read())
+        return _file_digest(stream, _md5).hexdigest()
+
+
+def files_md5_hex(
+    paths: _Iterable[Pathlike], executor: _Executor = None, chunksize: int = 1
+) -> _Dict[_Path, str]:
+    """
+    Get md5 hex strings for many files, keyed by path. Files are hashed using
+    'executor' if one is provided, so that reading some files can overlap with
+    hashing others. For process pools, 'chunksize' sets how many files are
+    sent to a worker at once.
+    """
+
+    normalized = [normalize(path) for path in paths]
+    hashes = (
+        map(file_md5_hex, normalized)
+        if executor is None
+        else executor.map(file_md5_hex, normalized, chunksize=chunksize)
+    )
+    return dict(zip(normalized, hashes))
@@ -0,0 +1,49 @@
+"""
+A module for writing data to files.
+"""
+
+# built-in
+import os as _os
+from typing import Iterable as _Iterable
+
+# internal
+from vcorelib import DEFAULT_ENCODING as _DEFAULT_ENCODING
+from vcorelib.paths.base import Pathlike, normalize
+
+# Binary mode only matters on Windows.
+_FLAGS = _os.O_WRONLY | _os.O_CREAT | _os.O_TRUNC | getattr(_os, "O_BINARY", 0)
+
+
+def fast_write_bytes(path: Pathlike, data: bytes) -> int:
+    """
+    Write bytes to a file (replacing any existing contents) without going
+    through Python's buffered file objects.
+    """
+
+    view = memoryview(data)
+    size = len(view)
+
+    fd = _os.open(normalize(path), _FLAGS, 0o666)
+    try:
+        # A single write can be partial, keep writing until everything is out.
+        while view:
+            view = view[_os.write(fd, view) :]
+    finally:
+        _os.close(fd)
+
+    return size
+
+
+def write_lines(
+    path: Pathlike,
+    lines: _Iterable[str],
+    line_ending: str = _os.linesep,
+    encoding: str = _DEFAULT_ENCODING,
+) -> int:
+    """
+    Write lines of text to a file (replacing any existing contents) with a
+    single write.
+    """
+
+    data = "".join(line + line_ending for line in lines)
+    return fast_write_bytes(path, data.encode(encoding))
@@ -4,12 +4,14 @@ environments.
 """
 
 # built-in
+from functools import lru_cache as _lru_cache
 from os import environ as _environ
 from pathlib import Path as _Path
 from shutil import which as _which
 from sys import executable as _executable
 from sys import version_info as _version_info
 from typing import NamedTuple
+from typing import Optional as _Optional
 
 # internal
 from vcorelib.paths import Pathlike as _Pathlike
@@ -62,9 +64,8 @@ def venv_dir(cwd: _Pathlike, version: str = None) -> _Path:
     return _normalize(cwd).joinpath(venv_name(version))
 
 
-def venv_bin(
-    cwd: _Pathlike, program: str = None, version: str = None
-) -> _Path:
+@_lru_cache(maxsize=64)
+def _venv_bin(cwd: _Path, program: _Optional[str], version: str) -> _Path:
     """Get the path to a virtual environment's script directory."""
 
     path = venv_dir(cwd, version).joinpath(
@@ -75,6 +76,17 @@ def venv_bin(
     return path
 
 
+def venv_bin(
+    cwd: _Pathlike, program: str = None, version: str = None
+) -> _Path:
+    """Get the path to a virtual environment's script directory."""
+
+    # Resolve the version first, it can depend on the environment.
+    if version is None:
+        version = python_version()
+    return _venv_bin(_normalize(cwd), program, version)
+
+
 class StrToBool(NamedTuple):
     """A container for results when converting strings to boolean."""
 
@@ -84,8 +96,9 @@ class StrToBool(NamedTuple):
     @staticmethod
     def parse(data: str) -> "StrToBool":
         """Parse a string to boolean."""
+        return STR_TO_BOOL.get(data.lower(), STR_TO_BOOL_INVALID)
+
 
-        data = data.lower()
-        is_true = data == "true"
-        resolved = is_true or data == "false"
-        return StrToBool(is_true, resolved)
+# Results are immutable, so every parse of the same string can share one.
+STR_TO_BOOL = {"true": StrToBool(True, True), "false": StrToBool(False, True)}
+STR_TO_BOOL_INVALID = StrToBool(False, False)
@@ -3,6 +3,7 @@ A module for working with various schema enforcement implementations.
 """
 
 # built-in
+from collections import OrderedDict as _OrderedDict
 from typing import Any as _Any
 from typing import Type as _Type
 
@@ -14,6 +15,23 @@ from vcorelib.io.types import JsonObject as _JsonObject
 from vcorelib.schemas.base import Schema as _Schema
 from vcorelib.schemas.base import SchemaMap as _SchemaMap
 from vcorelib.schemas.base import SchemaValidationError
+from vcorelib.schemas.base import cached_schema_object as _cached
+
+VALIDATORS: _OrderedDict[str, _Validator] = _OrderedDict()
+
+
+def cerberus_validator(data: _JsonObject, **kwargs) -> _Validator:
+    """
+    Get a new validator for a schema. Schemas without additional options are
+    only checked (when the schema definition is built) once.
+    """
+
+    if kwargs:
+        return _Validator(data, **kwargs)
+
+    # Validators hold per-validation state, so each caller gets its own (that
+    # shares the already-checked schema definition).
+    return _Validator(_cached(VALIDATORS, data, _Validator).schema)
 
 
 class CerberusSchema(_Schema):
@@ -22,7 +40,7 @@ class CerberusSchema(_Schema):
     def __init__(self, data: _JsonObject, **kwargs) -> None:
         """Initialize this schema."""
         super().__init__(data)
-        self.validator = _Validator(data, **kwargs)
+        self.validator = cerberus_validator(data, **kwargs)
 
     def __call__(self, data: _Any) -> _Any:
         """Validate input data and return the result."""
@@ -4,8 +4,12 @@ A module defining interfaces for schema enforcement.
 
 # built-in
 import abc as _abc
+from collections import OrderedDict as _OrderedDict
 from collections import UserDict
+from contextlib import suppress as _suppress
+from json import dumps as _dumps
 from typing import Any as _Any
+from typing import Callable as _Callable
 from typing import Iterator as _Iterator
 from typing import MutableMapping as _MutableMapping
 from typing import Tuple as _Tuple
@@ -21,6 +25,45 @@ from vcorelib.paths import normalize as _normalize
 from vcorelib.paths import resource as _resource
 
 T = _TypeVar("T", bound="Schema")
+C = _TypeVar("C")
+
+# The number of objects kept by each schema-object cache.
+SCHEMA_CACHE_SIZE = 64
+
+
+def cached_schema_object(
+    cache: _OrderedDict[str, C],
+    data: _JsonObject,
+    factory: _Callable[[_JsonObject], C],
+) -> C:
+    """
+    Get an object created from schema data, re-using one created from
+    equivalent data if possible (only the most recently used objects are
+    kept).
+    """
+
+    try:
+        key = _dumps(data, sort_keys=True)
+
+    # Not every schema can be serialized (e.g. ones containing callables or
+    # keys of mixed types), don't cache these.
+    except (TypeError, ValueError):
+        return factory(data)
+
+    result = cache.get(key)
+    if result is None:
+        result = factory(data)
+        cache[key] = result
+
+        # Entries may be removed concurrently, which is harmless.
+        while len(cache) > SCHEMA_CACHE_SIZE:
+            with _suppress(KeyError):
+                cache.popitem(last=False)
+    else:
+        with _suppress(KeyError):
+            cache.move_to_end(key)
+
+    return result
 
 
 class SchemaValidationError(Exception):
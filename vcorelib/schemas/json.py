@@ -3,8 +3,10 @@ A module for interacting with JSON schemas.
 """
 
 # built-in
+from collections import OrderedDict as _OrderedDict
 from logging import getLogger as _getLogger
 from typing import Any as _Any
+from typing import Callable as _Callable
 from typing import Type as _Type
 
 # third-party
@@ -19,6 +21,7 @@ from vcorelib.paths import find_file
 from vcorelib.schemas.base import Schema as _Schema
 from vcorelib.schemas.base import SchemaMap as _SchemaMap
 from vcorelib.schemas.base import SchemaValidationError
+from vcorelib.schemas.base import cached_schema_object as _cached
 
 LOG = _getLogger(__name__)
 
@@ -34,6 +37,27 @@ def package_handler(uri: str) -> _JsonObject:
     ).data
 
 
+JsonValidator = _Callable[[_Any], _Any]
+VALIDATORS: _OrderedDict[str, JsonValidator] = _OrderedDict()
+
+
+def _compile_schema(data: _JsonObject) -> JsonValidator:
+    """Compile a validator for a schema."""
+
+    result: JsonValidator = _compile(
+        data, handlers={"package": package_handler}
+    )
+    return result
+
+
+def json_validator(data: _JsonObject) -> JsonValidator:
+    """
+    Get a compiled validator for a schema. Recently used schemas are only
+    compiled once.
+    """
+    return _cached(VALIDATORS, data, _compile_schema)
+
+
 class JsonSchema(_Schema):
     """
     An object wrapper for: https://horejsek.github.io/python-fastjsonschema/.
@@ -44,7 +68,7 @@ class JsonSchema(_Schema):
     def __init__(self, data: _JsonObject, **_) -> None:
         """Initialize this schema."""
         super().__init__(data)
-        self.validator = _compile(data, handlers={"package": package_handler})
+        self.validator = json_validator(data)
 
     def __call__(self, data: _Any) -> _Any:
         """Validate input data and return the result."""
@@ -2,6 +2,11 @@
 A module for implementing schema-validated classes.
 """
 
+# built-in
+from typing import ClassVar as _ClassVar
+from typing import Optional as _Optional
+from typing import Tuple as _Tuple
+
 # internal
 from vcorelib.schemas.base import Schema as _Schema
 from vcorelib.schemas.base import SchemaMap as _SchemaMap
@@ -15,19 +20,39 @@ class SchemaMixin:
 
     schema: _Schema
 
+    # The most recently resolved schema for each class (and the map that it
+    # was resolved from).
+    _resolved_schema: _ClassVar[_Tuple[_SchemaMap, _Schema]]
+
     def __init__(self, schemas: _SchemaMap, valid_attr: str = "data") -> None:
         """Initialize this object instance by performing schema validation."""
 
         # Don't double initialize.
         if not hasattr(self, "schema"):
-            # Allow the name of the schema to be overridden if necessary.
-            schema = self.schema_name()
-            assert schema in schemas, f"No schema for '{schema}'!"
-            self.schema = schemas[schema]
+            self.schema = self.resolve_schema(schemas)
 
             # Perform validation.
             self.validate(valid_attr=valid_attr)
 
+    @classmethod
+    def resolve_schema(cls, schemas: _SchemaMap) -> _Schema:
+        """
+        Get this class's schema from a schema map. The result is cached on the
+        class so that creating many instances doesn't repeat the lookup.
+        """
+
+        resolved: _Optional[_Tuple[_SchemaMap, _Schema]] = cls.__dict__.get(
+            "_resolved_schema"
+        )
+        if resolved is None or resolved[0] is not schemas:
+            # Allow the name of the schema to be overridden if necessary.
+            schema = cls.schema_name()
+            assert schema in schemas, f"No schema for '{schema}'!"
+            resolved = (schemas, schemas[schema])
+            cls._resolved_schema = resolved
+
+        return resolved[1]
+
     @classmethod
     def schema_name(cls) -> str:
         """A default name for this class's schema."""
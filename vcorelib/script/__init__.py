@@ -7,33 +7,64 @@ import importlib.machinery
 import importlib.util
 from pathlib import Path as _Path
 from sys import path as _path
+from types import ModuleType as _ModuleType
 from typing import Any as _Any
+from typing import Dict as _Dict
 from typing import Set as _Set
+from typing import Tuple as _Tuple
 
 # internal
 from vcorelib.paths import Pathlike as _Pathlike
 from vcorelib.paths import normalize as _normalize
 
+# Loaded script modules (and the modification time and size they were loaded
+# at) by resolved path.
+MODULES: _Dict[str, _Tuple[_Tuple[int, int], _ModuleType]] = {}
 
-def invoke_script(script: _Pathlike, method: str, *args, **kwargs) -> _Any:
-    """Invoke a method from an external script."""
+
+def load_script(script: _Pathlike) -> _ModuleType:
+    """
+    Load an external script as a module. A script is only loaded again if its
+    modification time or size changes.
+    """
 
     path = _normalize(script)
 
-    # Add the parent directory to the system path so that the external script
-    # can load adjacent modules.
-    parent = str(path.parent.resolve())
+    # Cache on the resolved path (so that links to a script share a module)
+    # but load from the given path, so that '__file__' and the system path
+    # reflect what the caller provided.
+    key = str(path.resolve())
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    entry = MODULES.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    # Add the parent directory to the system path so that the external
+    # script can load adjacent modules.
+    parent = str(path.parent)
     if parent not in _path:
         _path.append(parent)
 
     loader = importlib.machinery.SourceFileLoader("script", str(path))
     spec = importlib.util.spec_from_loader("script", loader)
     assert spec is not None
-    script_module = importlib.util.module_from_spec(spec)
-    loader.exec_module(script_module)
+    result = importlib.util.module_from_spec(spec)
+    loader.exec_module(result)
 
-    # Invoke the script method.
-    return getattr(script_module, method)(*args, **kwargs)
+    # Replace any module loaded from an earlier version of this script.
+    MODULES[key] = (stamp, result)
+    return result
+
+
+def invoke_script(script: _Pathlike, method: str, *args, **kwargs) -> _Any:
+    """
+    Invoke a method from an external script. The script is only executed
+    again when it changes, so module-level state in the script persists
+    between calls.
+    """
+    return getattr(load_script(script), method)(*args, **kwargs)
 
 
 class ScriptableMixin:
@@ -109,10 +109,7 @@ class Target(TargetInterface[DynamicTargetEvaluator]):
         if result is None:
             return NO_MATCH
 
+        # Groups appear in the same order as the keys they were created for.
         return TargetMatch(
-            True,
-            {
-                key: result.group(1 + idx)
-                for idx, key in enumerate(self.evaluator.keys)
-            },
+            True, dict(zip(self.evaluator.keys, result.groups()))
         )
@@ -22,7 +22,7 @@ from vcorelib.asyncio import shutdown_loop as _shutdown_loop
 from vcorelib.dict import merge
 from vcorelib.script import ScriptableMixin
 from vcorelib.target import TargetMatch
-from vcorelib.target.resolver import TargetResolver
+from vcorelib.target.resolver import TargetResolution, TargetResolver
 from vcorelib.task import Task, TaskFailed
 
 BasicCoroutine = _Callable[[], _Coroutine[_Any, _Any, None]]
@@ -46,6 +46,9 @@ class TaskManager(ScriptableMixin):
         self.resolver = resolver
         self.eloop = _new_event_loop()
 
+        # Target resolutions are cached until a new task is registered.
+        self.resolutions: _Dict[str, TargetResolution] = {}
+
     def register(
         self,
         task: Task,
@@ -64,6 +67,7 @@ class TaskManager(ScriptableMixin):
         # Don't take any action if we didn't actually register the task.
         if self.resolver.register(target, task):
             self.tasks[task.name] = task
+            self.resolutions.clear()
             new_task = True
 
         # If we're adding more dependencies, make sure it's for the same task.
@@ -85,6 +89,15 @@ class TaskManager(ScriptableMixin):
         """Register dependencies to a task by name."""
         return self.register(self.tasks[target], dependencies)
 
+    def resolve(self, data: str) -> TargetResolution:
+        """Resolve a task string to a task, re-using previous results."""
+
+        result = self.resolutions.get(data)
+        if result is None:
+            result = self.resolver.evaluate(data)
+            self.resolutions[data] = result
+        return result
+
     def finalize(self, **kwargs) -> None:
         """Register task dependencies while the event loop is running."""
 
@@ -94,14 +107,15 @@ class TaskManager(ScriptableMixin):
                 task_obj.dependencies = []
                 for dep in deps:
                     # If the dependency points to a task by name, add it.
-                    if dep in self.tasks:
+                    dep_task = self.tasks.get(dep)
+                    if dep_task is not None:
                         task_obj.depend_on(
-                            self.tasks[dep], eloop=self.eloop, **kwargs
+                            dep_task, eloop=self.eloop, **kwargs
                         )
                         continue
 
                     # Ensure the dependency can be matched to a task otherwise.
-                    resolution = self.resolver.evaluate(dep)
+                    resolution = self.resolve(dep)
                     assert (
                         resolution
                     ), f"Couldn't match '{dep}' to task '{task}'!"
@@ -137,9 +151,10 @@ class TaskManager(ScriptableMixin):
 
         unresolved: _Set[str] = set()
         task_objs: _List[_Tuple[Task, TargetMatch]] = []
-        for resolved in self.resolver.evaluate_all(tasks):
-            if isinstance(resolved, str):
-                unresolved.add(resolved)
+        for task in tasks:
+            resolved = self.resolve(task)
+            if not resolved:
+                unresolved.add(task)
                 continue
             task_objs.append((cast(Task, resolved.data), resolved.result))
 
@@ -3,7 +3,7 @@ A module implementing a task that can be used to sleep.
 """
 
 # built-in
-import asyncio
+from asyncio import sleep as _sleep
 
 # internal
 from vcorelib.task import Inbox as _Inbox
@@ -21,5 +21,5 @@ class SleepTask(Task):
         # Allow duration to be specified by keyword argument or positional.
         keyword = {**kwargs}
         duration = keyword.get("duration", args[0])
-        await asyncio.sleep(duration)
+        await _sleep(duration)
         return True